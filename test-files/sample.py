@@ -1,16 +1,168 @@
 # Sample Python file for testing the parser
+import functools
+import hashlib
 import json
 import logging
+import math
+import re
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib codec
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # fall back to hashlib's blake2b
+    xxhash = None
+
+try:
+    import numpy as np
+except ImportError:  # numeric stats fall back to builtins
+    np = None
+
+# ISO datetimes share the YYYY-MM-DD prefix, so one alternation covers all date shapes
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}')
+
+_TRUTHY = frozenset(('true', 'yes', '1'))
+_FALSY = frozenset(('false', 'no', '0'))
+
+# Fast path for common numeric types; subclasses fall back to isinstance checks
+_NUMERIC_TYPES = frozenset((int, float, bool))
+
+# Any run of 19+ digits may be an integer literal beyond the 64-bit range
+_LONG_DIGITS_RE = re.compile(r'[0-9]{19}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+# Upper bound on key layouts tracked for, and holding, a generated transform function
+_MAX_SCHEMA_CACHE = 256
+
+# Below this many values the ndarray conversion costs more than the builtins save
+_NUMPY_STATS_THRESHOLD = 1024
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document, preferring orjson when available"""
+    if orjson is not None:
+        # orjson reads integers outside the 64-bit range as lossy floats
+        long_digits = _LONG_DIGITS_BYTES_RE if isinstance(data, bytes) else _LONG_DIGITS_RE
+        if long_digits.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity literals and overflowing exponents are stdlib-only
+                pass
+    return json.loads(data)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether NaN or +/-inf appears anywhere in data, dict keys included"""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        # Exact-type checks first; they are much cheaper than isinstance chains
+        if value_type is str or value_type is int or value_type is bool or value is None:
+            continue
+        if value_type is float or isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value)
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _json_dumps_sorted(data: Any) -> bytes:
+    """Serialize data with sorted keys as bytes, preferring orjson when available"""
+    if orjson is not None:
+        try:
+            dumped = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the stdlib encoder handles
+            pass
+        else:
+            # orjson writes NaN and +/-inf as null; the stdlib keeps them distinct from None
+            if b'null' not in dumped or not _has_non_finite(data):
+                return dumped
+    return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+def _hash64(data: bytes) -> int:
+    """Hash bytes to a 64-bit integer, preferring xxh3 when available"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+# Sentinel for cache misses, since None is a legitimate cached result
+_MISS = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_snake(key: str) -> str:
+    """Convert camelCase to snake_case in one scan over the key"""
+    if not isinstance(key, str):
+        # re.sub raised here too; without the check tuples would be scanned item by item
+        raise TypeError(f"expected str key, got {type(key).__name__!r}")
+    out = []
+    append = out.append
+    last = len(key) - 1
+    prev = ''
+    for i, c in enumerate(key):
+        # An ASCII capital gets an underscore when it starts a capitalized word
+        # (Xxx) or follows a lowercase letter or digit. The original pattern
+        # '(.)([A-Z][a-z]+)' needs any character before the word, and '.' does
+        # not match a newline, hence the prev != '\n' condition
+        if 'A' <= c <= 'Z' and i:
+            if (('a' <= prev <= 'z') or ('0' <= prev <= '9')
+                    or (i < last and 'a' <= key[i + 1] <= 'z' and prev != '\n')):
+                append('_')
+        append(c)
+        prev = c
+    return ''.join(out).lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_cached(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, reusing results for repeated values"""
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_domain_cached(url: str) -> str:
+    """Extract domain from URL"""
+    try:
+        return urlparse(url).netloc
+    except Exception:
+        return ''
+
 
 class LegacyDataProcessor:
+    __slots__ = (
+        'config', '_cache_data', '_cache_ts', 'logger', 'max_cache_size',
+        'cache_ttl', '_schema_cache', '_schema_seen', '_raw_keys'
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
-        self.cache = {}
+        self._cache_data = OrderedDict()
+        self._cache_ts = {}
+        # Raw JSON text key -> structural cache key, kept outside the result LRU
+        self._raw_keys = OrderedDict()
         self.logger = logging.getLogger(__name__)
         self.max_cache_size = self.config.get('max_cache_size', 1000)
         self.cache_ttl = self.config.get('cache_ttl', 3600)
+        # Compiled transforms per key layout, and layouts seen once so far
+        self._schema_cache = OrderedDict()
+        self._schema_seen = OrderedDict()
         
     def process_data(self, data: Any, processing_type: str = 'default') -> Any:
         """Process data with complex legacy logic"""
@@ -20,83 +172,120 @@ class LegacyDataProcessor:
             self.logger.warning("No data provided for processing")
             return None
             
-        if isinstance(data, str):
+        now = time.monotonic()
+        raw_key = None
+        if isinstance(data, (str, bytes)):
+            # Probe with a hash of the raw text so repeated inputs skip JSON decoding
+            raw_key = self._generate_raw_cache_key(data, processing_type)
+            cache_key = self._raw_keys.get(raw_key)
+            if cache_key is not None:
+                cached = self._cache_get(cache_key, now)
+                if cached is not _MISS:
+                    self._raw_keys.move_to_end(raw_key)
+                    return cached
             try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
+                data = _json_loads(data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 self.logger.error("Invalid JSON string provided")
                 return None
         
         # Check cache first
         cache_key = self._generate_cache_key(data, processing_type)
-        if cache_key in self.cache:
-            cache_entry = self.cache[cache_key]
-            if datetime.now() - cache_entry['timestamp'] < timedelta(seconds=self.cache_ttl):
-                self.logger.info(f"Returning cached result for key: {cache_key}")
-                return cache_entry['data']
-            else:
-                # Remove expired entry
-                del self.cache[cache_key]
+        if raw_key is not None:
+            self._remember_raw_key(raw_key, cache_key)
+        cached = self._cache_get(cache_key, now)
+        if cached is not _MISS:
+            return cached
         
         # Process based on type
-        processed_data = None
-        if processing_type == 'normalize':
-            processed_data = self._normalize_data(data)
-        elif processing_type == 'aggregate':
-            processed_data = self._aggregate_data(data)
-        elif processing_type == 'filter':
-            processed_data = self._filter_data(data)
-        elif processing_type == 'transform':
-            processed_data = self._transform_data(data)
-        else:
-            processed_data = self._default_processing(data)
+        handler = getattr(self, self._DISPATCH.get(processing_type, '_default_processing'))
+        processed_data = handler(data)
         
-        # Cache the result if cache is not full
-        if len(self.cache) < self.max_cache_size:
-            self.cache[cache_key] = {
-                'data': processed_data,
-                'timestamp': datetime.now()
-            }
-        elif len(self.cache) >= self.max_cache_size:
-            # Remove oldest entry
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k]['timestamp'])
-            del self.cache[oldest_key]
-            self.cache[cache_key] = {
-                'data': processed_data,
-                'timestamp': datetime.now()
-            }
+        self._cache_put(cache_key, processed_data, now)
         
         return processed_data
     
+    def _cache_get(self, cache_key: int, now: float) -> Any:
+        """Return a live cached result, or _MISS if absent or expired"""
+        cached_at = self._cache_ts.get(cache_key)
+        if cached_at is None:
+            return _MISS
+        if now - cached_at < self.cache_ttl:
+            self.logger.info(f"Returning cached result for key: {cache_key}")
+            self._cache_data.move_to_end(cache_key)
+            return self._cache_data[cache_key]
+        # Remove expired entry
+        del self._cache_data[cache_key]
+        del self._cache_ts[cache_key]
+        return _MISS
+    
+    def _cache_put(self, cache_key: int, value: Any, now: float) -> None:
+        """Store a result, evicting the least recently used entry if the cache is full"""
+        if len(self._cache_data) >= self.max_cache_size:
+            oldest_key, _ = self._cache_data.popitem(last=False)
+            del self._cache_ts[oldest_key]
+        self._cache_data[cache_key] = value
+        self._cache_ts[cache_key] = now
+    
+    def _remember_raw_key(self, raw_key: int, cache_key: int) -> None:
+        """Map raw JSON text to its structural key, bounded like the result cache"""
+        if raw_key in self._raw_keys:
+            self._raw_keys.move_to_end(raw_key)
+        elif len(self._raw_keys) >= self.max_cache_size:
+            self._raw_keys.popitem(last=False)
+        self._raw_keys[raw_key] = cache_key
+    
     def _normalize_data(self, data: Any) -> Any:
         """Normalize data with complex logic"""
         if isinstance(data, dict):
+            get_name = self._NORMALIZERS.get
+            # Bound handlers resolved once per value type for this dict
+            handlers = {}
             normalized = {}
             for key, value in data.items():
-                # Complex normalization logic
-                if isinstance(value, str):
-                    if value.lower() in ['true', 'yes', '1']:
-                        normalized[key.lower()] = True
-                    elif value.lower() in ['false', 'no', '0']:
-                        normalized[key.lower()] = False
-                    elif value.isdigit():
-                        normalized[key.lower()] = int(value)
-                    else:
-                        try:
-                            normalized[key.lower()] = float(value)
-                        except ValueError:
-                            normalized[key.lower()] = value.strip().lower()
-                elif isinstance(value, (list, dict)):
-                    normalized[key.lower()] = self._normalize_data(value)
-                else:
-                    normalized[key.lower()] = value
+                value_type = type(value)
+                handler = handlers.get(value_type)
+                if handler is None:
+                    handler = handlers[value_type] = getattr(
+                        self, get_name(value_type, '_normalize_value')
+                    )
+                normalized[key.lower()] = handler(value)
             return normalized
         elif isinstance(data, list):
-            return [self._normalize_data(item) for item in data]
+            normalize = self._normalize_data
+            return [normalize(item) for item in data]
         else:
             return data
     
+    def _normalize_str(self, value: str) -> Any:
+        """Coerce a string value to bool, int, float or a cleaned-up string"""
+        # Every truthy/falsy word is at most five characters long
+        if len(value) <= 5:
+            lv = value.lower()
+            if lv in _TRUTHY:
+                return True
+            if lv in _FALSY:
+                return False
+        if value.isdigit():
+            return int(value)
+        try:
+            return float(value)
+        except ValueError:
+            return value.strip().lower()
+    
+    def _normalize_value(self, value: Any) -> Any:
+        """Normalize a value whose exact type is not in _NORMALIZERS"""
+        if isinstance(value, str):
+            return self._normalize_str(value)
+        elif isinstance(value, (list, dict)):
+            return self._normalize_data(value)
+        else:
+            return value
+    
+    def _keep_value(self, value: Any) -> Any:
+        """Return scalar values unchanged"""
+        return value
+    
     def _aggregate_data(self, data: Any) -> Dict[str, Any]:
         """Aggregate data with multiple conditions"""
         if not isinstance(data, list):
@@ -109,27 +298,59 @@ class LegacyDataProcessor:
             'string_stats': {}
         }
         
-        # Count types
+        # Count types and partition values in a single pass
+        types = defaultdict(int)
+        numeric_values = []
+        string_values = []
+        float_count = 0
         for item in data:
-            item_type = type(item).__name__
-            result['types'][item_type] = result['types'].get(item_type, 0) + 1
+            item_type = type(item)
+            types[item_type.__name__] += 1
+            if item_type is float:
+                numeric_values.append(item)
+                float_count += 1
+            elif item_type in _NUMERIC_TYPES:
+                numeric_values.append(item)
+            elif item_type is str:
+                string_values.append(item)
+            elif isinstance(item, (int, float)):
+                numeric_values.append(item)
+            elif isinstance(item, str):
+                string_values.append(item)
+        result['types'] = dict(types)
         
-        # Numeric aggregations
-        numeric_values = [item for item in data if isinstance(item, (int, float))]
-        if numeric_values:
+        # Numeric aggregations; the float64 reduction only matches builtin
+        # semantics (exact int sums, no overflow) when every value is a float
+        arr = None
+        if (np is not None and float_count > _NUMPY_STATS_THRESHOLD
+                and float_count == len(numeric_values)):
+            arr = np.fromiter(numeric_values, dtype=np.float64, count=len(numeric_values))
+            # argmin/argmax return the first NaN, while builtin min/max only
+            # yield NaN when it comes first, so NaN input stays on the builtins
+            if np.isnan(arr).any():
+                arr = None
+        if arr is not None:
+            result['numeric_stats'] = {
+                'min': numeric_values[int(arr.argmin())],
+                'max': numeric_values[int(arr.argmax())],
+                'avg': float(arr.mean()),
+                'sum': float(arr.sum())
+            }
+        elif numeric_values:
+            total = sum(numeric_values)
             result['numeric_stats'] = {
                 'min': min(numeric_values),
                 'max': max(numeric_values),
-                'avg': sum(numeric_values) / len(numeric_values),
-                'sum': sum(numeric_values)
+                'avg': total / len(numeric_values),
+                'sum': total
             }
         
         # String aggregations
-        string_values = [item for item in data if isinstance(item, str)]
         if string_values:
+            total_length = sum([len(s) for s in string_values])
             result['string_stats'] = {
-                'total_length': sum(len(s) for s in string_values),
-                'avg_length': sum(len(s) for s in string_values) / len(string_values),
+                'total_length': total_length,
+                'avg_length': total_length / len(string_values),
                 'unique_count': len(set(string_values))
             }
         
@@ -139,10 +360,11 @@ class LegacyDataProcessor:
         """Filter data based on complex criteria"""
         if isinstance(data, list):
             filtered = []
+            cutoff = datetime.now() - timedelta(days=365)
             for item in data:
                 # Complex filtering logic
                 if isinstance(item, dict):
-                    if self._should_include_dict(item):
+                    if self._should_include_dict(item, cutoff):
                         filtered.append(item)
                 elif isinstance(item, str):
                     if len(item) > 0 and not item.isspace():
@@ -156,7 +378,7 @@ class LegacyDataProcessor:
         else:
             return data
     
-    def _should_include_dict(self, item: Dict[str, Any]) -> bool:
+    def _should_include_dict(self, item: Dict[str, Any], cutoff: datetime) -> bool:
         """Complex logic to determine if dict should be included"""
         if 'status' in item:
             if item['status'] in ['active', 'enabled', 'valid']:
@@ -176,8 +398,8 @@ class LegacyDataProcessor:
         
         if 'created_at' in item:
             try:
-                created = datetime.fromisoformat(item['created_at'])
-                if datetime.now() - created < timedelta(days=365):
+                created = _parse_iso_cached(item['created_at'])
+                if created > cutoff:
                     return True
                 else:
                     return False
@@ -189,24 +411,55 @@ class LegacyDataProcessor:
     def _transform_data(self, data: Any) -> Any:
         """Transform data with multiple transformation rules"""
         if isinstance(data, dict):
-            transformed = {}
-            for key, value in data.items():
-                # Apply transformation rules
-                new_key = self._transform_key(key)
-                new_value = self._transform_value(value)
-                transformed[new_key] = new_value
-            return transformed
+            # Records sharing a key layout reuse one generated function
+            signature = tuple(data)
+            transform = self._schema_cache.get(signature)
+            if transform is not None:
+                self._schema_cache.move_to_end(signature)
+            else:
+                transform = self._compile_schema_transform(signature)
+            if transform is not None:
+                return transform(data, self._transform_value)
+            # Apply transformation rules
+            transform_key = self._transform_key
+            transform_value = self._transform_value
+            return {
+                transform_key(key): transform_value(value)
+                for key, value in data.items()
+            }
         elif isinstance(data, list):
-            return [self._transform_data(item) for item in data]
+            transform = self._transform_data
+            return [transform(item) for item in data]
         else:
             return data
     
+    def _compile_schema_transform(self, keys: tuple) -> Optional[Callable]:
+        """Generate and cache a transform specialized for one key layout"""
+        if not all(type(key) is str for key in keys):
+            return None
+        # Only layouts seen twice get compiled, so one-off records skip exec
+        if keys not in self._schema_seen:
+            if len(self._schema_seen) >= _MAX_SCHEMA_CACHE:
+                self._schema_seen.popitem(last=False)
+            self._schema_seen[keys] = None
+            return None
+        del self._schema_seen[keys]
+        fields = ', '.join(
+            f'{self._transform_key(key)!r}: transform_value(d[{key!r}])' for key in keys
+        )
+        source = f'def _transform_schema(d, transform_value):\n    return {{{fields}}}\n'
+        namespace = {}
+        exec(source, namespace)
+        transform = namespace['_transform_schema']
+        if len(self._schema_cache) >= _MAX_SCHEMA_CACHE:
+            self._schema_cache.popitem(last=False)
+        self._schema_cache[keys] = transform
+        return transform
+    
     def _transform_key(self, key: str) -> str:
         """Transform dictionary keys"""
         # Convert camelCase to snake_case
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return _to_snake(key)
     
     def _transform_value(self, value: Any) -> Any:
         """Transform values based on type and content"""
@@ -219,7 +472,7 @@ class LegacyDataProcessor:
                     return value
             # URL transformation
             elif value.startswith(('http://', 'https://')):
-                return {'url': value, 'domain': self._extract_domain(value)}
+                return {'url': value, 'domain': _extract_domain_cached(value)}
             else:
                 return value
         elif isinstance(value, (dict, list)):
@@ -229,43 +482,57 @@ class LegacyDataProcessor:
     
     def _is_date_string(self, value: str) -> bool:
         """Check if string looks like a date"""
-        import re
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{2}/\d{2}/\d{4}',
-            r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'
-        ]
-        return any(re.match(pattern, value) for pattern in date_patterns)
-    
-    def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL"""
-        from urllib.parse import urlparse
-        try:
-            return urlparse(url).netloc
-        except Exception:
-            return ''
+        return _DATE_RE.match(value) is not None
     
     def _default_processing(self, data: Any) -> Any:
         """Default processing logic"""
         return data
     
-    def _generate_cache_key(self, data: Any, processing_type: str) -> str:
+    def _generate_cache_key(self, data: Any, processing_type: str) -> int:
         """Generate cache key from data and processing type"""
-        import hashlib
-        data_str = json.dumps(data, sort_keys=True, default=str)
-        key_input = f"{processing_type}:{data_str}"
-        return hashlib.md5(key_input.encode()).hexdigest()
+        data_str = _json_dumps_sorted(data)
+        key_input = b"%s:%s" % (str(processing_type).encode(), data_str)
+        return _hash64(key_input)
+    
+    def _generate_raw_cache_key(self, data: Any, processing_type: str) -> int:
+        """Generate cache key from undecoded JSON text and processing type"""
+        if isinstance(data, str):
+            data = data.encode('utf-8', 'surrogatepass')
+        return _hash64(b"%s:%s" % (str(processing_type).encode(), data))
     
     def clear_cache(self) -> None:
         """Clear the cache"""
-        self.cache.clear()
+        self._cache_data.clear()
+        self._cache_ts.clear()
+        self._raw_keys.clear()
         self.logger.info("Cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         return {
-            'size': len(self.cache),
+            'size': len(self._cache_data),
             'max_size': self.max_cache_size,
             'ttl': self.cache_ttl,
-            'keys': list(self.cache.keys())
-        }
\ No newline at end of file
+            'keys': list(self._cache_data.keys())
+        }
+    
+    # processing_type -> handler method name; resolved per call so subclass
+    # overrides apply and instances hold no bound-method cycles
+    _DISPATCH = {
+        'normalize': '_normalize_data',
+        'aggregate': '_aggregate_data',
+        'filter': '_filter_data',
+        'transform': '_transform_data'
+    }
+    
+    # Exact value type -> normalizer method name for _normalize_data, resolved
+    # through the instance like _DISPATCH
+    _NORMALIZERS = {
+        str: '_normalize_str',
+        dict: '_normalize_data',
+        list: '_normalize_data',
+        int: '_keep_value',
+        float: '_keep_value',
+        bool: '_keep_value',
+        type(None): '_keep_value'
+    }
\ No newline at end of file
@@ -0,0 +1,83 @@
+# Modernized counterpart of the LegacyProcessor emitted by the
+# performance-validation generator (test/test-data/performance/realistic-*.py).
+# The generator keeps producing the legacy version; this module is not generated.
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this length JIT dispatch costs more than the compiled loop saves
+NUMBA_MIN_LENGTH = 256
+
+
+def _scale_loop(a, k):
+    out = np.empty_like(a)
+    for i in range(a.shape[0]):
+        out[i] = a[i] * k
+    return out
+
+
+if njit is not None and np is not None:
+    _scale = njit(_scale_loop)
+    # njit has no typing for longdouble or non-native byte orders
+    _NUMBA_DTYPES = frozenset(np.dtype(t) for t in (
+        np.int8, np.int16, np.int32, np.int64,
+        np.uint8, np.uint16, np.uint32, np.uint64,
+        np.float32, np.float64,
+    ))
+else:
+    _scale = None
+    _NUMBA_DTYPES = frozenset()
+
+
+class LegacyProcessor:
+    __slots__ = ('data', 'processed_count')
+
+    def __init__(self):
+        self.data = {}
+        self.processed_count = 0
+
+    def process_data(self, input_data):
+        results = []
+        append = results.append
+
+        for item in input_data:
+            if type(item) is dict:
+                item_type = item.get('type')
+                if item_type == 'user':
+                    append(self.process_user(item))
+                elif item_type == 'order':
+                    append(self.process_order(item))
+
+            self.processed_count += 1
+
+        return results
+
+    def helper_method(self, param, k):
+        # ndarrays scale in one vectorized pass; lists keep Python int semantics
+        if np is not None and isinstance(param, np.ndarray):
+            if (_scale is not None and param.ndim == 1 and param.dtype.isnative
+                    and param.dtype in _NUMBA_DTYPES
+                    and param.shape[0] >= NUMBA_MIN_LENGTH):
+                return list(_scale(param, k))
+            return list(param * k)
+        return [value * k for value in param]
+
+
+def _make_helper(k):
+    def helper(self, param):
+        return self.helper_method(param, k)
+    helper.__name__ = f'helper_method_{k - 1}'
+    return helper
+
+
+# Same helper_method_0..N surface the generator emits for a 350-line file
+for _i in range(23):
+    setattr(LegacyProcessor, f'helper_method_{_i}', _make_helper(_i + 1))